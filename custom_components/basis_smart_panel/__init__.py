@@ -1,8 +1,14 @@
 from __future__ import annotations
 
-from homeassistant.config_entries import ConfigEntry
+import asyncio
+
+from collections.abc import Iterable
+
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_entry_oauth2_flow, device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.loader import async_get_loaded_integration
 
 from .const import (
     DOMAIN,
@@ -12,11 +18,18 @@ from .const import (
     LOGGER,
 )
 
-from .coordinator import BoardsDiscoveryCoordinator, SwitchboardDataCoordinator, EnergyStatsCoordinator
+from .coordinator import (
+    BasisConfigEntry,
+    BasisRuntime,
+    BoardsDiscoveryCoordinator,
+    ConfigMetadataCoordinator,
+    SwitchboardDataCoordinator,
+    EnergyStatsCoordinator,
+)
 from .api import BasisAPI, AsyncConfigEntryAuth
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: BasisConfigEntry) -> bool:
     """Set up Basis Panel from a config entry."""
     implementation = (
         await config_entry_oauth2_flow.async_get_config_entry_implementation(
@@ -29,25 +42,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     auth = AsyncConfigEntryAuth(session)
 
     # Get integration version from manifest
-    integration = hass.data["integrations"][DOMAIN]
-    integration_version = integration.version
+    integration_version = async_get_loaded_integration(hass, DOMAIN).version
 
     # Initialize API
-    api = BasisAPI(auth, integration_version)
-
-    # Set up data structure
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = {
-        "api": api,
-        "boards_coordinator": None,
-        "switchboard_coordinators": {},
-        "energy_coordinators": {},
-    }
+    api = BasisAPI(auth, async_get_clientsession(hass), integration_version)
+    entry.async_on_unload(api.async_close)
 
     # Create boards discovery coordinator
     boards_coordinator = BoardsDiscoveryCoordinator(hass, entry, api)
     await boards_coordinator.async_config_entry_first_refresh()
-    hass.data[DOMAIN][entry.entry_id]["boards_coordinator"] = boards_coordinator
+
+    # Set up runtime data
+    entry.runtime_data = BasisRuntime(api=api, boards=boards_coordinator)
 
     # Create a coordinator for each discovered switchboard
     await _async_setup_switchboard_coordinators(hass, entry, api, boards_coordinator)
@@ -55,6 +61,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register devices for each switchboard
     await _async_register_switchboard_devices(hass, entry, boards_coordinator)
 
+    # Remove devices of boards that disappeared while we were not running
+    _async_remove_orphaned_devices(hass, entry, boards_coordinator.switchboard_serial_set)
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -62,8 +71,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     @callback
     def _async_on_boards_update() -> None:
         """Handle boards discovery updates."""
-        hass.async_create_task(
-            _async_handle_boards_change(hass, entry, api, boards_coordinator)
+        entry.async_create_background_task(
+            hass,
+            _async_handle_boards_change(hass, entry, api, boards_coordinator),
+            name=f"{DOMAIN}_boards_change",
         )
 
     entry.async_on_unload(
@@ -75,46 +86,119 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def _async_setup_switchboard_coordinators(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: BasisConfigEntry,
     api: BasisAPI,
     boards_coordinator: BoardsDiscoveryCoordinator,
 ) -> None:
     """Set up data coordinators for each switchboard."""
-    switchboard_coordinators = hass.data[DOMAIN][entry.entry_id]["switchboard_coordinators"]
-    energy_coordinators = hass.data[DOMAIN][entry.entry_id]["energy_coordinators"]
+    # Bundle all first refreshes into one eagerly started background task
+    # instead of tracking each against bootstrap's startup wait list
+    await entry.async_create_background_task(
+        hass,
+        _async_create_coordinators(
+            hass, entry, api, boards_coordinator.switchboard_serial_set
+        ),
+        name=f"{DOMAIN}_first_refresh",
+        eager_start=True,
+    )
 
-    for serial in boards_coordinator.switchboard_serials:
-        if serial not in switchboard_coordinators:
-            # Create switchboard data coordinator
-            coordinator = SwitchboardDataCoordinator(hass, api, serial)
-            await coordinator.async_config_entry_first_refresh()
-            switchboard_coordinators[serial] = coordinator
-            LOGGER.debug(f"Created coordinator for switchboard {serial}")
 
-            # Create energy stats coordinator
-            energy_coordinator = EnergyStatsCoordinator(hass, api, serial)
-            await energy_coordinator.async_config_entry_first_refresh()
-            energy_coordinators[serial] = energy_coordinator
-            LOGGER.debug(f"Created energy coordinator for switchboard {serial}")
+async def _async_create_coordinators(
+    hass: HomeAssistant,
+    entry: BasisConfigEntry,
+    api: BasisAPI,
+    serials: Iterable[str],
+) -> None:
+    """Create and refresh the coordinators for new switchboards.
+
+    Refreshes for all boards run concurrently; coordinators are only stored
+    once every refresh has completed. Boards that already have a coordinator
+    are skipped so they are never refreshed twice.
+
+    Boards whose coordinators could not be refreshed are left in
+    runtime.pending_coordinators, and those same coordinators are refreshed
+    again on the next call.
+    """
+    runtime = entry.runtime_data
+
+    # A config entry first refresh is only supported while the entry is
+    # being set up. Boards discovered later get a plain refresh instead and
+    # are only kept once all their coordinators have data; the caller retries
+    # pending boards on the next discovery update.
+    in_setup = entry.state is ConfigEntryState.SETUP_IN_PROGRESS
+
+    new_coordinators: list[
+        tuple[
+            str,
+            SwitchboardDataCoordinator,
+            ConfigMetadataCoordinator,
+            EnergyStatsCoordinator,
+        ]
+    ] = []
+    refreshes = []
+    for serial in serials:
+        if serial in runtime.switchboards:
+            continue
+        board_coordinators = runtime.pending_coordinators.pop(serial, None)
+        if board_coordinators is None:
+            board_coordinators = (
+                SwitchboardDataCoordinator(hass, api, serial),
+                ConfigMetadataCoordinator(hass, api, serial),
+                EnergyStatsCoordinator(hass, api, serial),
+            )
+        new_coordinators.append((serial, *board_coordinators))
+        for new_coordinator in board_coordinators:
+            if new_coordinator.data is not None:
+                # Already refreshed by an earlier, partially failed attempt
+                continue
+            if in_setup:
+                refreshes.append(new_coordinator.async_config_entry_first_refresh())
+            else:
+                refreshes.append(new_coordinator.async_refresh())
+
+    results = await asyncio.gather(*refreshes, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    for serial, coordinator, metadata_coordinator, energy_coordinator in new_coordinators:
+        if (
+            coordinator.data is None
+            or metadata_coordinator.data is None
+            or energy_coordinator.data is None
+        ):
+            LOGGER.warning(f"Could not fetch data for switchboard {serial}, will retry")
+            runtime.pending_coordinators[serial] = (
+                coordinator,
+                metadata_coordinator,
+                energy_coordinator,
+            )
+            continue
+        runtime.switchboards[serial] = coordinator
+        LOGGER.debug("Created coordinator for switchboard %s", serial)
+        runtime.metadata[serial] = metadata_coordinator
+        LOGGER.debug("Created config coordinator for switchboard %s", serial)
+        runtime.energy[serial] = energy_coordinator
+        LOGGER.debug("Created energy coordinator for switchboard %s", serial)
 
 
 async def _async_register_switchboard_devices(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: BasisConfigEntry,
     boards_coordinator: BoardsDiscoveryCoordinator,
 ) -> None:
     """Register each switchboard as a device."""
     device_registry = dr.async_get(hass)
-    switchboard_coordinators = hass.data[DOMAIN][entry.entry_id]["switchboard_coordinators"]
+    metadata_coordinators = entry.runtime_data.metadata
 
     for board_info in boards_coordinator.data or []:
         serial = board_info["serial"]
-        coordinator = switchboard_coordinators.get(serial)
+        coordinator = metadata_coordinators.get(serial)
 
         if coordinator and coordinator.data:
             switchboard_data = coordinator.data
             model = switchboard_data.get("model", DEFAULT_MODEL)
-            subcircuits_version = switchboard_data.get("subcircuits", [{}])[0].get("config", {}).get("version", "Unknown")
+            subcircuits_version = switchboard_data.get("_first_subcircuit_version") or "Unknown"
 
             if (model == "unknown"):
                 model = DEFAULT_MODEL
@@ -128,51 +212,78 @@ async def _async_register_switchboard_devices(
                 sw_version=switchboard_data.get("version"),
                 hw_version=subcircuits_version,
             )
-            LOGGER.debug(f"Registered device for switchboard {serial}")
+            LOGGER.debug("Registered device for switchboard %s", serial)
+
+
+@callback
+def _async_remove_orphaned_devices(
+    hass: HomeAssistant,
+    entry: BasisConfigEntry,
+    current_serials: frozenset[str],
+) -> None:
+    """Remove registered devices whose switchboard is no longer available."""
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        serials = {
+            identifier[1] for identifier in device.identifiers if identifier[0] == DOMAIN
+        }
+        if serials and not serials & current_serials:
+            device_registry.async_remove_device(device.id)
+            LOGGER.info(f"Removed orphaned device for switchboards {serials}")
 
 
 async def _async_handle_boards_change(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: BasisConfigEntry,
     api: BasisAPI,
     boards_coordinator: BoardsDiscoveryCoordinator,
 ) -> None:
     """Handle added or removed switchboards."""
-    switchboard_coordinators = hass.data[DOMAIN][entry.entry_id]["switchboard_coordinators"]
-    energy_coordinators = hass.data[DOMAIN][entry.entry_id]["energy_coordinators"]
-
-    current_serials = set(boards_coordinator.switchboard_serials)
-    coordinator_serials = set(switchboard_coordinators.keys())
-
-    # Also check device registry for any orphaned devices
-    device_registry = dr.async_get(hass)
-    registry_serials: set[str] = set()
-    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
-        for identifier in device.identifiers:
-            if identifier[0] == DOMAIN:
-                registry_serials.add(identifier[1])
+    runtime = entry.runtime_data
+    if (
+        not boards_coordinator.added_serials
+        and not boards_coordinator.removed_serials
+        and not runtime.pending_coordinators
+    ):
+        return
 
-    # Devices to remove: in registry but not in current API response
-    removed_serials = registry_serials - current_serials
-    # New boards: in API but not in our coordinators
-    new_serials = current_serials - coordinator_serials
+    # One reconcile at a time; updates queued behind it find their changes
+    # already applied and do nothing
+    async with runtime.boards_change_lock:
+        await _async_reconcile_boards(hass, entry, api, boards_coordinator)
 
-    if not new_serials and not removed_serials:
-        return
 
-    # Unload platforms first (removes entities)
-    await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+async def _async_reconcile_boards(
+    hass: HomeAssistant,
+    entry: BasisConfigEntry,
+    api: BasisAPI,
+    boards_coordinator: BoardsDiscoveryCoordinator,
+) -> None:
+    """Add and remove switchboards according to the latest discovery update."""
+    runtime = entry.runtime_data
+    switchboard_coordinators = runtime.switchboards
+
+    # The deltas persist across failed discovery refreshes and queued
+    # reconciles, so only act on boards that still need handling
+    removed_serials = boards_coordinator.removed_serials & switchboard_coordinators.keys()
+    for serial in boards_coordinator.removed_serials:
+        runtime.pending_coordinators.pop(serial, None)
+    new_serials = (
+        boards_coordinator.added_serials | runtime.pending_coordinators.keys()
+    ) - switchboard_coordinators.keys()
 
     # Handle removed boards
     if removed_serials:
         LOGGER.info(f"Removing switchboards: {removed_serials}")
+        device_registry = dr.async_get(hass)
 
         for serial in removed_serials:
             # Clean up coordinators
             switchboard_coordinators.pop(serial, None)
-            energy_coordinators.pop(serial, None)
+            runtime.metadata.pop(serial, None)
+            runtime.energy.pop(serial, None)
 
-            # Remove device from registry
+            # Remove device from registry (its entities are removed with it)
             device = device_registry.async_get_device(identifiers={(DOMAIN, serial)})
             if device:
                 device_registry.async_remove_device(device.id)
@@ -184,28 +295,22 @@ async def _async_handle_boards_change(
     if new_serials:
         LOGGER.info(f"Setting up new switchboards: {new_serials}")
 
-        for serial in new_serials:
-            # Switchboard data coordinator
-            coordinator = SwitchboardDataCoordinator(hass, api, serial)
-            await coordinator.async_config_entry_first_refresh()
-            switchboard_coordinators[serial] = coordinator
-
-            # Energy stats coordinator
-            energy_coordinator = EnergyStatsCoordinator(hass, api, serial)
-            await energy_coordinator.async_config_entry_first_refresh()
-            energy_coordinators[serial] = energy_coordinator
+        await _async_create_coordinators(hass, entry, api, new_serials)
 
         # Register new devices
         await _async_register_switchboard_devices(hass, entry, boards_coordinator)
 
-    # Reload platforms with updated coordinators
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        # Add entities for the new boards to the already set up platforms
+        add_entities = runtime.add_entities
+        if len(add_entities) < len(PLATFORMS):
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+            return
 
+        for serial in new_serials & switchboard_coordinators.keys():
+            for async_add_switchboard in add_entities.values():
+                async_add_switchboard(serial)
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
 
-    return unload_ok
+async def async_unload_entry(hass: HomeAssistant, entry: BasisConfigEntry) -> bool:
+    """Unload a config entry."""
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
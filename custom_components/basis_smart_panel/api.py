@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import cast
+import asyncio
+import logging
+from typing import Any, cast
 
+from aiohttp import ClientSession
 from homeassistant.helpers import config_entry_oauth2_flow
 from gql import Client, gql
+from gql.client import AsyncClientSession
 from gql.transport.aiohttp import AIOHTTPTransport
 
 from .const import (
@@ -11,6 +15,116 @@ from .const import (
     API_BASE_URL
 )
 
+# GraphQL documents are parsed once at import rather than on every call.
+_Q_SWITCHBOARDS = gql("""
+    query {
+        sites(input: { query: "" }) {
+            sites {
+                id
+                switchboards {
+                    serial
+                    connectivity {
+                        connected
+                    }
+                }
+            }
+        }
+    }
+""")
+
+# Slow-changing board and subcircuit configuration (labels, versions, locks)
+_Q_SWITCHBOARD_CONFIG = gql("""
+    query GetSwitchboardConfig($serial: String!) {
+        switchboard(serial: $serial) {
+            serial
+            model
+            version
+            subcircuits {
+                serial
+                number
+                config {
+                    label
+                    standbyLocked
+                    version
+                }
+            }
+        }
+    }
+""")
+
+# Fast-changing connectivity and live readings
+_Q_SWITCHBOARD_LIVE_STATE = gql("""
+    query GetSwitchboardLiveState($serial: String!) {
+        switchboard(serial: $serial) {
+            serial
+            connectivity {
+                connected
+                updatedTimestamp
+                disconnectReason
+            }
+            liveState {
+                power
+                powerUsage {
+                    importPower
+                    exportPower
+                }
+                primaryCurrent
+                updatedTimestamp
+            }
+            subcircuits {
+                serial
+                liveState {
+                    state
+                    power
+                    primaryCurrent
+                    phaseVoltage
+                    updatedTimestamp
+                }
+            }
+        }
+    }
+""")
+
+_Q_SWITCHBOARD_ENERGY_USAGE = gql("""
+    query GetSwitchboardEnergyUsage($serial: String!, $startTime: Time!) {
+        switchboard(serial: $serial) {
+            totalSwitchboardEnergyUsage(input: { startTime: $startTime }) {
+                importKwh
+                exportKwh
+            }
+        }
+    }
+""")
+
+_Q_SWITCHBOARD_ENERGY_SUMMARY = gql("""
+    query GetSwitchboardEnergySummary(
+        $serial: String!, $todayStart: Time!, $monthStart: Time!
+    ) {
+        switchboard(serial: $serial) {
+            today: totalSwitchboardEnergyUsage(input: { startTime: $todayStart }) {
+                importKwh
+                exportKwh
+            }
+            month: totalSwitchboardEnergyUsage(input: { startTime: $monthStart }) {
+                importKwh
+                exportKwh
+            }
+        }
+    }
+""")
+
+_M_SET_SUBCIRCUIT_STANDBY = gql("""
+    mutation UpdateSubcircuitStandby($input: UpdateSubcircuitStandbyStateInput!) {
+        updateSubcircuitStandbyState(input: $input) {
+            serial
+            liveState {
+                state
+            }
+        }
+    }
+""")
+
+
 class AsyncConfigEntryAuth():
     """Provide Basis Smart Panel authentication tied to an OAuth2 based config entry."""
 
@@ -20,46 +134,105 @@ class AsyncConfigEntryAuth():
     ) -> None:
         """Initialize Basis Smart Panel auth."""
         self._oauth_session = oauth_session
+        self._access_token: str | None = None
+        self._auth_headers: dict[str, str] = {}
 
     async def async_get_access_token(self) -> str:
         """Return a valid access token."""
         if not self._oauth_session.valid_token:
             await self._oauth_session.async_ensure_token_valid()
 
-        LOGGER.debug(f"token scope {self._oauth_session.token['scope']}")
-
         return cast(str, self._oauth_session.token["access_token"])
 
+    async def async_get_auth_headers(self) -> dict[str, str]:
+        """Return request headers carrying a valid bearer token.
+
+        The headers are rebuilt only when the access token changes, which
+        happens when it is refreshed.
+        """
+        access_token = await self.async_get_access_token()
+        if access_token != self._access_token:
+            self._access_token = access_token
+            self._auth_headers = {"Authorization": f"Bearer {access_token}"}
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("token scope %s", self._oauth_session.token['scope'])
+
+        return self._auth_headers
+
 
 class BasisAPI:
     """Basis Smart Panel API client."""
 
-    def __init__(self, auth: AsyncConfigEntryAuth, integration_version: str = "unknown") -> None:
+    def __init__(
+        self,
+        auth: AsyncConfigEntryAuth,
+        session: ClientSession,
+        integration_version: str = "unknown",
+    ) -> None:
         """Initialize the API client.
 
         Args:
             auth: AsyncConfigEntryAuth instance for OAuth2
+            session: Home Assistant's shared aiohttp session
             integration_version: Home Assistant integration version for User-Agent header
         """
         self._auth = auth
         self._integration_version = integration_version
 
-    async def _get_auth_token(self) -> str:
-        """Get the current authentication token."""
-        return await self._auth.async_get_access_token()
-
-    async def _create_client(self) -> Client:
-        """Create a new GraphQL client with current auth token."""
-        auth_token = await self._get_auth_token()
+        # One long-lived client for all calls. The transport borrows the
+        # connector of Home Assistant's shared session, so connections (and
+        # their TLS sessions) are pooled across polls and stay owned by HA.
         transport = AIOHTTPTransport(
             url=f'{API_BASE_URL}/query',
             headers={
                 'User-Agent': f'HomeAssistantBasisSmartPanelIntegration/{self._integration_version}',
-                'Authorization': f'Bearer {auth_token}',
             },
             ssl=True,
+            client_session_args={
+                "connector": session.connector,
+                "connector_owner": False,
+            },
         )
-        return Client(transport=transport, fetch_schema_from_transport=False)
+        self._client = Client(transport=transport, fetch_schema_from_transport=False)
+        self._session: AsyncClientSession | None = None
+        self._connect_lock = asyncio.Lock()
+
+    async def _get_auth_headers(self) -> dict[str, str]:
+        """Get the headers authenticating the current request."""
+        return await self._auth.async_get_auth_headers()
+
+    async def _get_session(self) -> AsyncClientSession:
+        """Return the connected GraphQL session, connecting on first use."""
+        if self._session is None:
+            async with self._connect_lock:
+                if self._session is None:
+                    self._session = await self._client.connect_async()
+        return self._session
+
+    async def _execute(self, document, variables: dict[str, Any] | None = None) -> dict:
+        """Execute a GraphQL document with the current auth token."""
+        session = await self._get_session()
+        auth_headers = await self._get_auth_headers()
+
+        # The token is sent per request; it rotates independently of the
+        # connection, so the pooled session never needs rebuilding.
+        return await session.execute(
+            document,
+            variable_values=variables,
+            extra_args={"headers": auth_headers},
+        )
+
+    async def async_close(self) -> None:
+        """Close the GraphQL session (the shared connector is left open)."""
+        if self._session is not None:
+            self._session = None
+            # With connector_owner=False, gql drops its aiohttp session on
+            # close without closing it. Close it here; a session that does
+            # not own its connector leaves the connector open.
+            transport_session = self._client.transport.session
+            if transport_session is not None:
+                await transport_session.close()
+            await self._client.close_async()
 
     async def get_available_switchboards(self) -> list[dict]:
         """Discover all switchboards available to the user.
@@ -67,25 +240,7 @@ class BasisAPI:
         Returns:
             List of switchboard info dicts with serial and connected status.
         """
-        client = await self._create_client()
-
-        query = gql("""
-            query {
-                sites(input: { query: "" }) {
-                    sites {
-                        id
-                        switchboards {
-                            serial
-                            connectivity {
-                                connected
-                            }
-                        }
-                    }
-                }
-            }
-        """)
-
-        result = await client.execute_async(query)
+        result = await self._execute(_Q_SWITCHBOARDS)
 
         # Flatten switchboards from all sites
         switchboards = []
@@ -98,58 +253,24 @@ class BasisAPI:
                     "connected": board.get("connectivity", {}).get("connected", False),
                 })
 
-        LOGGER.debug(f"Discovered {len(switchboards)} switchboards")
+        LOGGER.debug("Discovered %s switchboards", len(switchboards))
         return switchboards
 
-    async def get_switchboard_data(self, serial: str):
-        """Get switchboard data from the API."""
-        client = await self._create_client()
+    async def get_switchboard_config(self, serial: str):
+        """Get switchboard and subcircuit configuration from the API."""
+        variables = {
+            "serial": serial
+        }
 
-        query = gql("""
-            query GetSwitchboardData($serial: String!) {
-                switchboard(serial: $serial) {
-                    serial
-                    model
-                    version
-                    connectivity {
-                        connected
-                        updatedTimestamp
-                        disconnectReason
-                    }
-                    liveState {
-                        power
-                        powerUsage {
-                            importPower
-                            exportPower
-                        }
-                        primaryCurrent
-                        updatedTimestamp
-                    }
-                    subcircuits {
-                        serial
-                        number
-                        config {
-                            label
-                            standbyLocked
-                            version
-                        }
-                        liveState {
-                            state
-                            power
-                            primaryCurrent
-                            phaseVoltage
-                            updatedTimestamp
-                        }
-                    }
-                }
-            }
-        """)
+        return await self._execute(_Q_SWITCHBOARD_CONFIG, variables)
 
+    async def get_switchboard_live_state(self, serial: str):
+        """Get switchboard connectivity and live readings from the API."""
         variables = {
             "serial": serial
         }
 
-        return await client.execute_async(query, variables)
+        return await self._execute(_Q_SWITCHBOARD_LIVE_STATE, variables)
 
     async def get_switchboard_energy_usage(self, serial: str, start_time: str):
         """Get energy usage for the switchboard.
@@ -161,43 +282,42 @@ class BasisAPI:
         Returns:
             Energy usage data with import/export kWh
         """
-        client = await self._create_client()
-
-        query = gql("""
-            query GetSwitchboardEnergyUsage($serial: String!, $startTime: Time!) {
-                switchboard(serial: $serial) {
-                    totalSwitchboardEnergyUsage(input: { startTime: $startTime }) {
-                        importKwh
-                        exportKwh
-                    }
-                }
-            }
-        """)
-
         variables = {
             "serial": serial,
             "startTime": start_time,
         }
 
-        return await client.execute_async(query, variables)
+        return await self._execute(_Q_SWITCHBOARD_ENERGY_USAGE, variables)
+
+    async def get_switchboard_energy_summary(
+        self, serial: str, today_start: str, month_start: str
+    ):
+        """Get today's and this month's energy usage in a single request.
+
+        Args:
+            serial: Switchboard serial number
+            today_start: ISO 8601 formatted start of today
+            month_start: ISO 8601 formatted start of this month
+
+        Returns:
+            Energy usage data with import/export kWh under "today" and "month"
+        """
+        variables = {
+            "serial": serial,
+            "todayStart": today_start,
+            "monthStart": month_start,
+        }
+
+        return await self._execute(_Q_SWITCHBOARD_ENERGY_SUMMARY, variables)
 
     async def set_subcircuit_standby(
         self, switchboard_serial: str, subcircuit_serial: str, standby_state: bool
     ):
-        """Set subcircuit standby state."""
-        client = await self._create_client()
-
-        mutation = gql("""
-            mutation UpdateSubcircuitStandby($input: UpdateSubcircuitStandbyStateInput!) {
-                updateSubcircuitStandbyState(input: $input) {
-                    serial
-                    liveState {
-                        state
-                    }
-                }
-            }
-        """)
+        """Set subcircuit standby state.
 
+        Callers shield the write (see the circuit switch) so that a cancelled
+        caller cannot abort it mid-flight.
+        """
         variables = {
             "input": {
                 "switchboardSerial": switchboard_serial,
@@ -206,4 +326,4 @@ class BasisAPI:
             }
         }
 
-        return await client.execute_async(mutation, variables)
+        return await self._execute(_M_SET_SUBCIRCUIT_STANDBY, variables)
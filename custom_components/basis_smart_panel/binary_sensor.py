@@ -2,90 +2,85 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, LOGGER
-from .coordinator import SwitchboardDataCoordinator
+from .const import LOGGER
+from .coordinator import BasisConfigEntry, SwitchboardDataCoordinator
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: BasisConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Basis binary sensors."""
-    switchboard_coordinators: dict[str, SwitchboardDataCoordinator] = (
-        hass.data[DOMAIN][config_entry.entry_id]["switchboard_coordinators"]
-    )
+    runtime = config_entry.runtime_data
+    switchboard_coordinators = runtime.switchboards
+
+    @callback
+    def _async_add_switchboard(serial: str) -> None:
+        """Add binary sensors for a newly discovered switchboard."""
+        async_add_entities(
+            _switchboard_entities(switchboard_coordinators[serial]),
+            update_before_add=False,
+        )
+
+    runtime.add_entities[Platform.BINARY_SENSOR] = _async_add_switchboard
 
     entities = []
 
-    for serial, coordinator in switchboard_coordinators.items():
-        switchboard_data = coordinator.data
-        if not switchboard_data:
-            LOGGER.warning(f"No data for switchboard {serial}, skipping binary sensors")
-            continue
+    for coordinator in switchboard_coordinators.values():
+        entities.extend(_switchboard_entities(coordinator))
+
+    async_add_entities(entities, update_before_add=False)
 
-        # Add connectivity sensor
-        entities.append(BasisConnectivitySensor(coordinator))
 
-    async_add_entities(entities)
+def _switchboard_entities(coordinator: SwitchboardDataCoordinator) -> list[BinarySensorEntity]:
+    """Build the binary sensors for a single switchboard."""
+    if not coordinator.data:
+        LOGGER.warning(f"No data for switchboard {coordinator.serial}, skipping binary sensors")
+        return []
+
+    # Add connectivity sensor
+    return [BasisConnectivitySensor(coordinator)]
 
 
 class BasisConnectivitySensor(CoordinatorEntity[SwitchboardDataCoordinator], BinarySensorEntity):
     """Binary sensor for switchboard connectivity status."""
 
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_name = "Connectivity"
 
     def __init__(self, coordinator: SwitchboardDataCoordinator) -> None:
         """Initialize the connectivity sensor."""
         super().__init__(coordinator)
-        self._serial = coordinator.serial
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for this entity."""
-        return f"basis_connectivity_{self._serial}"
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return "Connectivity"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info to link this entity to its device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._serial)},
-        )
-
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if connected."""
-        if not self.coordinator.data:
-            return None
-        connectivity = self.coordinator.data.get("connectivity", {})
-        return connectivity.get("connected", False)
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        # Always available - even if disconnected, the sensor shows that state
-        return self.coordinator.last_update_success
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional state attributes."""
+        serial = coordinator.serial
+        self._attr_unique_id = f"basis_connectivity_{serial}"
+        self._attr_device_info = coordinator.device_info
+        self._update_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Compute state and attributes from the coordinator data."""
         if not self.coordinator.data:
-            return {}
-        connectivity = self.coordinator.data.get("connectivity", {})
+            self._attr_is_on = None
+            self._attr_extra_state_attributes = {}
+            return
+
+        connectivity = self.coordinator.data.get("connectivity") or {}
+        self._attr_is_on = connectivity.get("connected", False)
+
         attrs = {}
         if connectivity.get("updatedTimestamp"):
             attrs["last_seen"] = connectivity["updatedTimestamp"]
         if connectivity.get("disconnectReason"):
             attrs["disconnect_reason"] = connectivity["disconnectReason"]
-        return attrs
+        self._attr_extra_state_attributes = attrs
@@ -35,7 +35,7 @@ class BasisSmartPanelConfigFlowHandler(
     @property
     def extra_authorize_data(self) -> dict[str, Any]:
         """Extra data that needs to be appended to the authorize url."""
-        LOGGER.debug(f"extra_authorize_data, scope: {OAUTH2_SCOPE}")
+        LOGGER.debug("extra_authorize_data, scope: %s", OAUTH2_SCOPE)
         return {
             "scope": OAUTH2_SCOPE,
             "audience": OAUTH2_AUDIENCE,
@@ -15,15 +15,25 @@ OAUTH2_TOKEN = "https://auth.wearebasis.com/oauth/token"
 OAUTH2_SCOPE = "home openid profile email offline_access"
 OAUTH2_AUDIENCE = "https://api.wearebasis.io"
 
+# Delay used to coalesce refresh requests (e.g. several switch toggles)
+REQUEST_REFRESH_DELAY = 0.35
+
 # Interval for discovering new boards
 BOARDS_DISCOVERY_INTERVAL = timedelta(minutes=5)
 
-# Interval for polling switchboard data
+# Interval for polling switchboard live state
 SWITCHBOARD_UPDATE_INTERVAL = timedelta(seconds=5)
 
+# Interval for polling switchboard configuration (labels, versions, locks)
+SWITCHBOARD_CONFIG_UPDATE_INTERVAL = timedelta(minutes=5)
+
 # Interval for polling energy statistics (less frequent)
 ENERGY_STATS_UPDATE_INTERVAL = timedelta(minutes=5)
 
+# Interval for re-fetching the month energy total; in between, it is
+# derived from today's total
+ENERGY_MONTH_RESYNC_INTERVAL = timedelta(hours=1)
+
 LOGGER = logging.getLogger(__package__)
 LOGGERFORHA = logging.getLogger(f"{__package__}_HA")
 
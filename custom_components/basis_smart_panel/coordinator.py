@@ -1,9 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
@@ -11,14 +19,50 @@ from .const import (
     DOMAIN,
     LOGGER,
     LOGGERFORHA,
+    REQUEST_REFRESH_DELAY,
     BOARDS_DISCOVERY_INTERVAL,
     SWITCHBOARD_UPDATE_INTERVAL,
+    SWITCHBOARD_CONFIG_UPDATE_INTERVAL,
     ENERGY_STATS_UPDATE_INTERVAL,
+    ENERGY_MONTH_RESYNC_INTERVAL,
+    LABEL_ICON_MAP,
+    LABEL_NAME_MAP,
 )
 
 if TYPE_CHECKING:
     from .api import BasisAPI
 
+# Subcircuit labels that are not exposed as entities
+_SKIP_LABELS = frozenset({"spare"})
+
+
+@dataclass
+class BasisRuntime:
+    """Runtime data for a Basis Smart Panel config entry."""
+
+    api: BasisAPI
+    boards: BoardsDiscoveryCoordinator
+    switchboards: dict[str, SwitchboardDataCoordinator] = field(default_factory=dict)
+    metadata: dict[str, ConfigMetadataCoordinator] = field(default_factory=dict)
+    energy: dict[str, EnergyStatsCoordinator] = field(default_factory=dict)
+    # Per-platform callbacks adding the entities of a newly discovered board
+    add_entities: dict[Platform, Callable[[str], None]] = field(default_factory=dict)
+    # Coordinators of discovered boards that could not be refreshed yet; kept
+    # so retries refresh them again instead of building new ones
+    pending_coordinators: dict[
+        str,
+        tuple[
+            SwitchboardDataCoordinator,
+            ConfigMetadataCoordinator,
+            EnergyStatsCoordinator,
+        ],
+    ] = field(default_factory=dict)
+    # Serialises board reconciliation between overlapping discovery updates
+    boards_change_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+BasisConfigEntry = ConfigEntry[BasisRuntime]
+
 
 class BoardsDiscoveryCoordinator(DataUpdateCoordinator):
     """Coordinator to discover available switchboards periodically."""
@@ -38,61 +82,195 @@ class BoardsDiscoveryCoordinator(DataUpdateCoordinator):
         )
         self._api = api
         self._entry = entry
-        self._known_serials: set[str] = set()
+        self._known_serials: frozenset[str] = frozenset()
+        # Boards added and removed by the latest discovery update
+        self.added_serials: frozenset[str] = frozenset()
+        self.removed_serials: frozenset[str] = frozenset()
 
     async def _async_update_data(self) -> list[dict]:
         """Fetch available switchboards from the API."""
         switchboards = await self._api.get_available_switchboards()
 
         # Track newly discovered boards
-        current_serials = {board["serial"] for board in switchboards}
+        current_serials = frozenset(board["serial"] for board in switchboards)
         new_serials = current_serials - self._known_serials
 
         if new_serials:
             LOGGER.info(f"Discovered new switchboards: {new_serials}")
 
+        self.added_serials = new_serials
+        self.removed_serials = self._known_serials - current_serials
         self._known_serials = current_serials
         return switchboards
 
     @property
-    def switchboard_serials(self) -> list[str]:
-        """Return list of discovered switchboard serials."""
-        if self.data is None:
-            return []
-        return [board["serial"] for board in self.data]
+    def switchboard_serial_set(self) -> frozenset[str]:
+        """Return the set of discovered switchboard serials."""
+        return self._known_serials
 
 
-class SwitchboardDataCoordinator(DataUpdateCoordinator):
-    """Coordinator for a single switchboard's data updates."""
+class _SwitchboardCoordinator(DataUpdateCoordinator):
+    """Base for the coordinators polling a single switchboard."""
 
     def __init__(
         self,
         hass: HomeAssistant,
         api: BasisAPI,
         serial: str,
+        *,
+        name: str,
+        update_interval: timedelta,
+        **kwargs: Any,
     ) -> None:
-        """Initialize the switchboard data coordinator."""
+        """Initialize the switchboard coordinator."""
         super().__init__(
             hass,
             LOGGERFORHA,
-            name=f"{DOMAIN}_{serial}",
-            update_interval=SWITCHBOARD_UPDATE_INTERVAL,
+            name=name,
+            update_interval=update_interval,
+            # Skip notifying entities when a refresh returns identical data
+            always_update=False,
+            **kwargs,
         )
         self._api = api
         self._serial = serial
+        # Shared by all entities of this switchboard
+        self.device_info = DeviceInfo(identifiers={(DOMAIN, serial)})
 
     @property
     def serial(self) -> str:
         """Return the switchboard serial."""
         return self._serial
 
+
+class SwitchboardDataCoordinator(_SwitchboardCoordinator):
+    """Coordinator for a single switchboard's live state updates."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: BasisAPI,
+        serial: str,
+    ) -> None:
+        """Initialize the switchboard data coordinator."""
+        super().__init__(
+            hass,
+            api,
+            serial,
+            name=f"{DOMAIN}_{serial}",
+            update_interval=SWITCHBOARD_UPDATE_INTERVAL,
+            # Coalesce bursts of refresh requests into a single poll
+            request_refresh_debouncer=Debouncer(
+                hass,
+                LOGGERFORHA,
+                cooldown=REQUEST_REFRESH_DELAY,
+                immediate=False,
+            ),
+        )
+        # Live data per subcircuit, kept across refreshes and updated in place
+        self._subcircuits: dict[str, dict] = {}
+
+    def get_subcircuit(self, serial: str) -> dict:
+        """Return the live data of a subcircuit.
+
+        The same dict is updated in place on every refresh, so entities can
+        hold on to it. It is empty while the subcircuit is not reported.
+        """
+        return self._subcircuits.setdefault(serial, {})
+
+    async def _async_update_data(self) -> dict:
+        """Fetch switchboard live state from the API."""
+        data = await self._api.get_switchboard_live_state(self._serial)
+        switchboard = data.get("switchboard") or {}
+
+        # Panel live state, shared by all panel-level sensors
+        switchboard["_live_state"] = switchboard.get("liveState") or {}
+        power_usage = switchboard["_live_state"].get("powerUsage") or {}
+        switchboard["_import_power"] = power_usage.get("importPower")
+        switchboard["_export_power"] = power_usage.get("exportPower")
+
+        # Refresh the persistent subcircuit dicts in place. The update is
+        # shallow, so each one shares its liveState with the subcircuit in
+        # the returned data, and an optimistic switch write also lands in
+        # coordinator.data. That is intended: a later poll is compared with
+        # the written state, and entities are notified if the board reports
+        # something else.
+        reported = {
+            subcircuit["serial"]: subcircuit
+            for subcircuit in switchboard.get("subcircuits") or []
+        }
+        for serial, existing in self._subcircuits.items():
+            if serial not in reported:
+                existing.clear()
+        for serial, subcircuit in reported.items():
+            self.get_subcircuit(serial).update(subcircuit)
+        return switchboard
+
+
+class ConfigMetadataCoordinator(_SwitchboardCoordinator):
+    """Coordinator for a single switchboard's configuration.
+
+    Labels, versions and standby locks rarely change, so they are polled far
+    less often than the live state.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: BasisAPI,
+        serial: str,
+    ) -> None:
+        """Initialize the switchboard configuration coordinator."""
+        super().__init__(
+            hass,
+            api,
+            serial,
+            name=f"{DOMAIN}_{serial}_config",
+            update_interval=SWITCHBOARD_CONFIG_UPDATE_INTERVAL,
+        )
+
+    def get_subcircuit(self, serial: str) -> dict | None:
+        """Return the latest configuration of a subcircuit, or None if unknown."""
+        return self.data["_subcircuits_by_serial"].get(serial)
+
     async def _async_update_data(self) -> dict:
-        """Fetch switchboard data from the API."""
-        data = await self._api.get_switchboard_data(self._serial)
-        return data.get("switchboard", {})
+        """Fetch switchboard configuration from the API."""
+        data = await self._api.get_switchboard_config(self._serial)
+        switchboard = data.get("switchboard") or {}
+
+        subcircuits = switchboard.get("subcircuits") or []
 
+        # Resolve label-derived display values once for all entities
+        for subcircuit in subcircuits:
+            label_key = (subcircuit.get("config") or {}).get("label", "spare")
+            subcircuit["_label_key"] = label_key
+            subcircuit["_friendly_name"] = LABEL_NAME_MAP.get(label_key, label_key)
+            subcircuit["_icon"] = LABEL_ICON_MAP.get(label_key)
+
+        # Index subcircuits once so entities can look themselves up directly
+        switchboard["_subcircuits_by_serial"] = {
+            subcircuit["serial"]: subcircuit for subcircuit in subcircuits
+        }
 
-class EnergyStatsCoordinator(DataUpdateCoordinator):
+        # Subcircuits that get entities: metered (not spare) and, of those,
+        # the ones whose standby can be switched
+        switchboard["_active_subcircuits"] = [
+            subcircuit
+            for subcircuit in subcircuits
+            if (subcircuit.get("config") or {}).get("label", "") not in _SKIP_LABELS
+        ]
+        switchboard["_switchable_subcircuits"] = [
+            subcircuit
+            for subcircuit in switchboard["_active_subcircuits"]
+            if not (subcircuit.get("config") or {}).get("standbyLocked", False)
+        ]
+        switchboard["_first_subcircuit_version"] = (
+            (subcircuits[0].get("config") or {}).get("version") if subcircuits else None
+        )
+        return switchboard
+
+
+class EnergyStatsCoordinator(_SwitchboardCoordinator):
     """Coordinator for energy statistics (today and this month)."""
 
     def __init__(
@@ -104,42 +282,64 @@ class EnergyStatsCoordinator(DataUpdateCoordinator):
         """Initialize the energy stats coordinator."""
         super().__init__(
             hass,
-            LOGGERFORHA,
+            api,
+            serial,
             name=f"{DOMAIN}_{serial}_energy",
             update_interval=ENERGY_STATS_UPDATE_INTERVAL,
         )
-        self._api = api
-        self._serial = serial
 
-    @property
-    def serial(self) -> str:
-        """Return the switchboard serial."""
-        return self._serial
+        # Period start timestamps, recomputed when the local date changes
+        self._period_date: date | None = None
+        self._today_start = ""
+        self._month_start = ""
+
+        # Month usage up to the start of today, from the last month fetch
+        self._month_before_today: dict | None = None
+        self._month_synced: datetime | None = None
 
     async def _async_update_data(self) -> dict:
         """Fetch energy statistics from the API."""
         now = dt_util.now()
 
-        # Start of today (midnight local time)
-        start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if now.date() != self._period_date:
+            # Start of today (midnight local time)
+            start_of_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        # Start of this month (first day at midnight local time)
-        start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            # Start of this month (first day at midnight local time)
+            start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
 
-        # Fetch energy for today
-        today_data = await self._api.get_switchboard_energy_usage(
-            self._serial,
-            start_of_today.isoformat(),
-        )
+            self._period_date = now.date()
+            self._today_start = start_of_today.isoformat()
+            self._month_start = start_of_month.isoformat()
+            self._month_before_today = None
 
-        # Fetch energy for this month
-        month_data = await self._api.get_switchboard_energy_usage(
-            self._serial,
-            start_of_month.isoformat(),
-        )
+        if (
+            self._month_before_today is None
+            or self._month_synced is None
+            or now - self._month_synced >= ENERGY_MONTH_RESYNC_INTERVAL
+        ):
+            # Fetch both periods in one round trip
+            data = await self._api.get_switchboard_energy_summary(
+                self._serial,
+                self._today_start,
+                self._month_start,
+            )
 
-        today_usage = today_data.get("switchboard", {}).get("totalSwitchboardEnergyUsage", {})
-        month_usage = month_data.get("switchboard", {}).get("totalSwitchboardEnergyUsage", {})
+            switchboard = data.get("switchboard") or {}
+            today_usage = switchboard.get("today") or {}
+            month_usage = switchboard.get("month") or {}
+
+            self._month_before_today = _subtract_usage(month_usage, today_usage)
+            self._month_synced = now
+        else:
+            # Month total is the usage before today plus today's total
+            data = await self._api.get_switchboard_energy_usage(
+                self._serial,
+                self._today_start,
+            )
+
+            today_usage = (data.get("switchboard") or {}).get("totalSwitchboardEnergyUsage") or {}
+            month_usage = _add_usage(self._month_before_today, today_usage)
 
         return {
             "today": {
@@ -151,3 +351,21 @@ class EnergyStatsCoordinator(DataUpdateCoordinator):
                 "export_kwh": month_usage.get("exportKwh"),
             },
         }
+
+
+_USAGE_KEYS = ("importKwh", "exportKwh")
+
+
+def _subtract_usage(usage: dict, other: dict) -> dict | None:
+    """Return usage minus other, or None if any value is missing."""
+    if any(usage.get(key) is None or other.get(key) is None for key in _USAGE_KEYS):
+        return None
+    return {key: usage[key] - other[key] for key in _USAGE_KEYS}
+
+
+def _add_usage(usage: dict, other: dict) -> dict:
+    """Return usage plus other, rounded to drop float noise."""
+    return {
+        key: round(usage[key] + other[key], 6) if other.get(key) is not None else None
+        for key in _USAGE_KEYS
+    }
@@ -0,0 +1,51 @@
+from abc import abstractmethod
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import ConfigMetadataCoordinator, SwitchboardDataCoordinator
+
+
+class BasisSubcircuitEntity(CoordinatorEntity[SwitchboardDataCoordinator]):
+    """Base for the entities of a single subcircuit.
+
+    The state comes from the live coordinator; the name and icon follow the
+    circuit label from the configuration coordinator.
+    """
+
+    def __init__(
+        self,
+        coordinator: SwitchboardDataCoordinator,
+        metadata_coordinator: ConfigMetadataCoordinator,
+        subcircuit: dict,
+    ) -> None:
+        """Initialize the subcircuit entity."""
+        super().__init__(coordinator)
+        self._metadata_coordinator = metadata_coordinator
+        self._subcircuit_serial = subcircuit["serial"]
+        self._subcircuit = coordinator.get_subcircuit(self._subcircuit_serial)
+        self._attr_device_info = coordinator.device_info
+        self._label_key = subcircuit["_label_key"]
+        self._update_label(subcircuit)
+
+    async def async_added_to_hass(self) -> None:
+        """Also follow configuration updates once added."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._metadata_coordinator.async_add_listener(self._handle_metadata_update)
+        )
+
+    @callback
+    def _handle_metadata_update(self) -> None:
+        """Publish a new name and icon when the subcircuit label changes."""
+        if not self._metadata_coordinator.data:
+            return
+        subcircuit = self._metadata_coordinator.get_subcircuit(self._subcircuit_serial)
+        if subcircuit and subcircuit["_label_key"] != self._label_key:
+            self._label_key = subcircuit["_label_key"]
+            self._update_label(subcircuit)
+            self.async_write_ha_state()
+
+    @abstractmethod
+    def _update_label(self, subcircuit: dict) -> None:
+        """Derive the name and icon from the subcircuit label."""
@@ -1,218 +1,204 @@
-from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 from homeassistant.components.sensor import (
     SensorEntity,
+    SensorEntityDescription,
     SensorDeviceClass,
     SensorStateClass,
 )
 from homeassistant.const import (
+    Platform,
     UnitOfPower,
     UnitOfElectricCurrent,
     UnitOfElectricPotential,
     UnitOfEnergy,
 )
 
-from .coordinator import SwitchboardDataCoordinator, EnergyStatsCoordinator
-from .const import (
-    DOMAIN,
-    LOGGER,
-    LABEL_ICON_MAP,
-    LABEL_NAME_MAP,
+from .coordinator import (
+    BasisConfigEntry,
+    ConfigMetadataCoordinator,
+    SwitchboardDataCoordinator,
+    EnergyStatsCoordinator,
 )
+from .const import LOGGER
+from .entity import BasisSubcircuitEntity
+
+_CoordinatorT = TypeVar("_CoordinatorT", bound=DataUpdateCoordinator)
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: BasisConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Basis sensors."""
-    switchboard_coordinators: dict[str, SwitchboardDataCoordinator] = (
-        hass.data[DOMAIN][config_entry.entry_id]["switchboard_coordinators"]
-    )
-    energy_coordinators: dict[str, EnergyStatsCoordinator] = (
-        hass.data[DOMAIN][config_entry.entry_id]["energy_coordinators"]
-    )
+    runtime = config_entry.runtime_data
+    switchboard_coordinators = runtime.switchboards
+    metadata_coordinators = runtime.metadata
+    energy_coordinators = runtime.energy
+
+    @callback
+    def _async_add_switchboard(serial: str) -> None:
+        """Add sensors for a newly discovered switchboard."""
+        async_add_entities(
+            _switchboard_entities(
+                switchboard_coordinators[serial],
+                metadata_coordinators[serial],
+                energy_coordinators.get(serial),
+            ),
+            update_before_add=False,
+        )
+
+    runtime.add_entities[Platform.SENSOR] = _async_add_switchboard
 
     entities = []
 
     for serial, coordinator in switchboard_coordinators.items():
-        switchboard_data = coordinator.data
-        if not switchboard_data:
-            LOGGER.warning(f"No data for switchboard {serial}, skipping sensors")
-            continue
-
-        # Switchboard-level sensors
-        entities.append(BasisPanelPowerSensor(coordinator))
-        entities.append(BasisPanelImportPowerSensor(coordinator))
-        entities.append(BasisPanelExportPowerSensor(coordinator))
-        entities.append(BasisPanelCurrentSensor(coordinator))
-
-        # Energy stats sensors
-        energy_coordinator = energy_coordinators.get(serial)
-        if energy_coordinator:
-            entities.append(BasisEnergyTodayImportSensor(energy_coordinator))
-            entities.append(BasisEnergyTodayExportSensor(energy_coordinator))
-            entities.append(BasisEnergyMonthImportSensor(energy_coordinator))
-            entities.append(BasisEnergyMonthExportSensor(energy_coordinator))
-
-        # Subcircuit sensors (skip spare circuits)
-        for subcircuit in switchboard_data.get("subcircuits", []):
-            label = subcircuit.get("config", {}).get("label", "")
-            if label == "spare":
-                continue
-            entities.append(BasisSubcircuitPowerSensor(coordinator, subcircuit))
-            entities.append(BasisSubcircuitCurrentSensor(coordinator, subcircuit))
-            entities.append(BasisSubcircuitVoltageSensor(coordinator, subcircuit))
-
-    async_add_entities(entities)
-
-
-# =============================================================================
-# Switchboard-level sensors
-# =============================================================================
-
-
-class BasisPanelPowerSensor(CoordinatorEntity[SwitchboardDataCoordinator], SensorEntity):
-    """Sensor for total panel power (net)."""
-
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_icon = "mdi:home-lightning-bolt"
-
-    def __init__(self, coordinator: SwitchboardDataCoordinator) -> None:
-        """Initialize the panel power sensor."""
-        super().__init__(coordinator)
-        self._serial = coordinator.serial
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_power_panel_{self._serial}"
+        entities.extend(
+            _switchboard_entities(
+                coordinator,
+                metadata_coordinators[serial],
+                energy_coordinators.get(serial),
+            )
+        )
+
+    async_add_entities(entities, update_before_add=False)
+
+
+def _switchboard_entities(
+    coordinator: SwitchboardDataCoordinator,
+    metadata_coordinator: ConfigMetadataCoordinator,
+    energy_coordinator: EnergyStatsCoordinator | None,
+) -> list[SensorEntity]:
+    """Build the sensors for a single switchboard."""
+    switchboard_config = metadata_coordinator.data
+    if not coordinator.data or not switchboard_config:
+        LOGGER.warning(f"No data for switchboard {coordinator.serial}, skipping sensors")
+        return []
 
-    @property
-    def name(self) -> str:
-        return "Current Power"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._serial)})
-
-    @property
-    def native_value(self) -> float | None:
-        if not self.coordinator.data:
-            return None
-        live_state = self.coordinator.data.get("liveState")
-        if live_state:
-            return live_state.get("power")
-        return None
-
-
-class BasisPanelImportPowerSensor(CoordinatorEntity[SwitchboardDataCoordinator], SensorEntity):
-    """Sensor for panel import power."""
-
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_icon = "mdi:transmission-tower-import"
-
-    def __init__(self, coordinator: SwitchboardDataCoordinator) -> None:
-        super().__init__(coordinator)
-        self._serial = coordinator.serial
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_import_power_{self._serial}"
+    entities = []
 
-    @property
-    def name(self) -> str:
-        return "Import Power"
+    # Switchboard-level sensors
+    entities.extend(
+        BasisPanelSensor(coordinator, description) for description in PANEL_SENSORS
+    )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._serial)})
+    # Energy stats sensors
+    if energy_coordinator:
+        entities.extend(
+            (
+                BasisEnergyTodayImportSensor(energy_coordinator),
+                BasisEnergyTodayExportSensor(energy_coordinator),
+                BasisEnergyMonthImportSensor(energy_coordinator),
+                BasisEnergyMonthExportSensor(energy_coordinator),
+            )
+        )
+
+    # Subcircuit sensors (spare circuits are filtered out by the coordinator)
+    entities.extend(
+        BasisSubcircuitSensor(coordinator, metadata_coordinator, subcircuit, description)
+        for subcircuit in switchboard_config["_active_subcircuits"]
+        for description in SUBCIRCUIT_SENSORS
+    )
 
-    @property
-    def native_value(self) -> float | None:
-        if not self.coordinator.data:
-            return None
-        live_state = self.coordinator.data.get("liveState")
-        if live_state:
-            power_usage = live_state.get("powerUsage", {})
-            return power_usage.get("importPower")
-        return None
+    return entities
 
 
-class BasisPanelExportPowerSensor(CoordinatorEntity[SwitchboardDataCoordinator], SensorEntity):
-    """Sensor for panel export power (solar)."""
+class BasisCoordinatorSensor(CoordinatorEntity[_CoordinatorT], SensorEntity):
+    """Coordinator sensor that only writes state when it actually changes."""
 
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-    _attr_icon = "mdi:transmission-tower-export"
+    _written_state: tuple[bool, Any] | None = None
 
-    def __init__(self, coordinator: SwitchboardDataCoordinator) -> None:
-        super().__init__(coordinator)
-        self._serial = coordinator.serial
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the value or availability changed."""
+        state = (self.available, self.native_value)
+        if state == self._written_state:
+            return
+        self._written_state = state
+        self.async_write_ha_state()
 
-    @property
-    def unique_id(self) -> str:
-        return f"basis_export_power_{self._serial}"
 
-    @property
-    def name(self) -> str:
-        return "Export Power"
+# =============================================================================
+# Switchboard-level sensors
+# =============================================================================
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._serial)})
 
-    @property
-    def native_value(self) -> float | None:
-        if not self.coordinator.data:
-            return None
-        live_state = self.coordinator.data.get("liveState")
-        if live_state:
-            power_usage = live_state.get("powerUsage", {})
-            return power_usage.get("exportPower")
-        return None
+@dataclass(frozen=True, kw_only=True)
+class BasisPanelSensorEntityDescription(SensorEntityDescription):
+    """Describes a switchboard-level Basis sensor."""
+
+    value_fn: Callable[[dict], float | None]
+
+
+PANEL_SENSORS: tuple[BasisPanelSensorEntityDescription, ...] = (
+    BasisPanelSensorEntityDescription(
+        key="power_panel",
+        name="Current Power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        icon="mdi:home-lightning-bolt",
+        value_fn=lambda data: data["_live_state"]["power"],
+    ),
+    BasisPanelSensorEntityDescription(
+        key="import_power",
+        name="Import Power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        icon="mdi:transmission-tower-import",
+        value_fn=lambda data: data["_import_power"],
+    ),
+    BasisPanelSensorEntityDescription(
+        key="export_power",
+        name="Export Power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        icon="mdi:transmission-tower-export",
+        value_fn=lambda data: data["_export_power"],
+    ),
+    BasisPanelSensorEntityDescription(
+        key="current",
+        name="Primary Current",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        icon="mdi:current-ac",
+        value_fn=lambda data: data["_live_state"]["primaryCurrent"],
+    ),
+)
 
 
-class BasisPanelCurrentSensor(CoordinatorEntity[SwitchboardDataCoordinator], SensorEntity):
-    """Sensor for panel primary current."""
+class BasisPanelSensor(BasisCoordinatorSensor[SwitchboardDataCoordinator]):
+    """Sensor for a switchboard-level live value (power, import/export, current)."""
 
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-    _attr_icon = "mdi:current-ac"
+    entity_description: BasisPanelSensorEntityDescription
 
-    def __init__(self, coordinator: SwitchboardDataCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: SwitchboardDataCoordinator,
+        description: BasisPanelSensorEntityDescription,
+    ) -> None:
+        """Initialize the panel sensor."""
         super().__init__(coordinator)
-        self._serial = coordinator.serial
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_current_{self._serial}"
-
-    @property
-    def name(self) -> str:
-        return "Primary Current"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._serial)})
+        self.entity_description = description
+        serial = coordinator.serial
+        self._attr_unique_id = f"basis_{description.key}_{serial}"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
-        if not self.coordinator.data:
+        try:
+            return self.entity_description.value_fn(self.coordinator.data)
+        except (TypeError, KeyError):
             return None
-        live_state = self.coordinator.data.get("liveState")
-        if live_state:
-            return live_state.get("primaryCurrent")
-        return None
 
 
 # =============================================================================
@@ -220,128 +206,96 @@ class BasisPanelCurrentSensor(CoordinatorEntity[SwitchboardDataCoordinator], Sen
 # =============================================================================
 
 
-class BasisEnergyTodayImportSensor(CoordinatorEntity[EnergyStatsCoordinator], SensorEntity):
+class BasisEnergyTodayImportSensor(BasisCoordinatorSensor[EnergyStatsCoordinator]):
     """Sensor for energy imported today."""
 
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_icon = "mdi:lightning-bolt"
+    _attr_name = "Energy Today Import"
 
     def __init__(self, coordinator: EnergyStatsCoordinator) -> None:
         super().__init__(coordinator)
-        self._serial = coordinator.serial
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_energy_today_import_{self._serial}"
-
-    @property
-    def name(self) -> str:
-        return "Energy Today Import"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._serial)})
+        serial = coordinator.serial
+        self._attr_unique_id = f"basis_energy_today_import_{serial}"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
-        if not self.coordinator.data:
+        try:
+            return self.coordinator.data["today"]["import_kwh"]
+        except (TypeError, KeyError):
             return None
-        return self.coordinator.data.get("today", {}).get("import_kwh")
 
 
-class BasisEnergyTodayExportSensor(CoordinatorEntity[EnergyStatsCoordinator], SensorEntity):
+class BasisEnergyTodayExportSensor(BasisCoordinatorSensor[EnergyStatsCoordinator]):
     """Sensor for energy exported today (solar)."""
 
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_icon = "mdi:solar-power"
+    _attr_name = "Energy Today Export"
 
     def __init__(self, coordinator: EnergyStatsCoordinator) -> None:
         super().__init__(coordinator)
-        self._serial = coordinator.serial
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_energy_today_export_{self._serial}"
-
-    @property
-    def name(self) -> str:
-        return "Energy Today Export"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._serial)})
+        serial = coordinator.serial
+        self._attr_unique_id = f"basis_energy_today_export_{serial}"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
-        if not self.coordinator.data:
+        try:
+            return self.coordinator.data["today"]["export_kwh"]
+        except (TypeError, KeyError):
             return None
-        return self.coordinator.data.get("today", {}).get("export_kwh")
 
 
-class BasisEnergyMonthImportSensor(CoordinatorEntity[EnergyStatsCoordinator], SensorEntity):
+class BasisEnergyMonthImportSensor(BasisCoordinatorSensor[EnergyStatsCoordinator]):
     """Sensor for energy imported this month."""
 
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_icon = "mdi:lightning-bolt"
+    _attr_name = "Energy This Month Import"
 
     def __init__(self, coordinator: EnergyStatsCoordinator) -> None:
         super().__init__(coordinator)
-        self._serial = coordinator.serial
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_energy_month_import_{self._serial}"
-
-    @property
-    def name(self) -> str:
-        return "Energy This Month Import"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._serial)})
+        serial = coordinator.serial
+        self._attr_unique_id = f"basis_energy_month_import_{serial}"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
-        if not self.coordinator.data:
+        try:
+            return self.coordinator.data["month"]["import_kwh"]
+        except (TypeError, KeyError):
             return None
-        return self.coordinator.data.get("month", {}).get("import_kwh")
 
 
-class BasisEnergyMonthExportSensor(CoordinatorEntity[EnergyStatsCoordinator], SensorEntity):
+class BasisEnergyMonthExportSensor(BasisCoordinatorSensor[EnergyStatsCoordinator]):
     """Sensor for energy exported this month (solar)."""
 
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_icon = "mdi:solar-power"
+    _attr_name = "Energy This Month Export"
 
     def __init__(self, coordinator: EnergyStatsCoordinator) -> None:
         super().__init__(coordinator)
-        self._serial = coordinator.serial
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_energy_month_export_{self._serial}"
-
-    @property
-    def name(self) -> str:
-        return "Energy This Month Export"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._serial)})
+        serial = coordinator.serial
+        self._attr_unique_id = f"basis_energy_month_export_{serial}"
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> float | None:
-        if not self.coordinator.data:
+        try:
+            return self.coordinator.data["month"]["export_kwh"]
+        except (TypeError, KeyError):
             return None
-        return self.coordinator.data.get("month", {}).get("export_kwh")
 
 
 # =============================================================================
@@ -349,155 +303,81 @@ class BasisEnergyMonthExportSensor(CoordinatorEntity[EnergyStatsCoordinator], Se
 # =============================================================================
 
 
-class BasisSubcircuitPowerSensor(CoordinatorEntity[SwitchboardDataCoordinator], SensorEntity):
-    """Sensor for subcircuit power."""
-
-    _attr_device_class = SensorDeviceClass.POWER
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfPower.WATT
-
-    def __init__(
-        self, coordinator: SwitchboardDataCoordinator, subcircuit: dict
-    ) -> None:
-        super().__init__(coordinator)
-        self._switchboard_serial = coordinator.serial
-        self._subcircuit_serial = subcircuit["serial"]
-        self._subcircuit_number = subcircuit["number"]
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_power_{self._switchboard_serial}_{self._subcircuit_serial}"
-
-    @property
-    def name(self) -> str:
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            label_key = subcircuit["config"].get("label", "spare")
-            friendly_name = LABEL_NAME_MAP.get(label_key, subcircuit["config"]["label"])
-            return f"[{self._subcircuit_number:02d}] {friendly_name} Power"
-        return f"[{self._subcircuit_number:02d}] Power"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._switchboard_serial)})
-
-    @property
-    def icon(self) -> str:
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            label_key = subcircuit["config"].get("label", "spare")
-            return LABEL_ICON_MAP.get(label_key, "mdi:flash")
-        return "mdi:flash"
-
-    @property
-    def native_value(self) -> float | None:
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            return subcircuit.get("liveState", {}).get("power")
-        return None
-
-    def _get_subcircuit(self) -> dict | None:
-        if not self.coordinator.data:
-            return None
-        for subcircuit in self.coordinator.data.get("subcircuits", []):
-            if subcircuit["serial"] == self._subcircuit_serial:
-                return subcircuit
-        return None
-
-
-class BasisSubcircuitCurrentSensor(CoordinatorEntity[SwitchboardDataCoordinator], SensorEntity):
-    """Sensor for subcircuit current."""
-
-    _attr_device_class = SensorDeviceClass.CURRENT
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
-    _attr_icon = "mdi:current-ac"
-
-    def __init__(
-        self, coordinator: SwitchboardDataCoordinator, subcircuit: dict
-    ) -> None:
-        super().__init__(coordinator)
-        self._switchboard_serial = coordinator.serial
-        self._subcircuit_serial = subcircuit["serial"]
-        self._subcircuit_number = subcircuit["number"]
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_current_{self._switchboard_serial}_{self._subcircuit_serial}"
-
-    @property
-    def name(self) -> str:
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            label_key = subcircuit["config"].get("label", "spare")
-            friendly_name = LABEL_NAME_MAP.get(label_key, subcircuit["config"]["label"])
-            return f"[{self._subcircuit_number:02d}] {friendly_name} Current"
-        return f"[{self._subcircuit_number:02d}] Current"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._switchboard_serial)})
-
-    @property
-    def native_value(self) -> float | None:
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            return subcircuit.get("liveState", {}).get("primaryCurrent")
-        return None
-
-    def _get_subcircuit(self) -> dict | None:
-        if not self.coordinator.data:
-            return None
-        for subcircuit in self.coordinator.data.get("subcircuits", []):
-            if subcircuit["serial"] == self._subcircuit_serial:
-                return subcircuit
-        return None
+@dataclass(frozen=True, kw_only=True)
+class BasisSubcircuitSensorEntityDescription(SensorEntityDescription):
+    """Describes a per-subcircuit Basis sensor."""
+
+    live_key: str
+    # Prefer the icon mapped from the circuit label, falling back to `icon`
+    label_icon: bool = False
+
+
+SUBCIRCUIT_SENSORS: tuple[BasisSubcircuitSensorEntityDescription, ...] = (
+    BasisSubcircuitSensorEntityDescription(
+        key="power",
+        name="Power",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfPower.WATT,
+        icon="mdi:flash",
+        live_key="power",
+        label_icon=True,
+    ),
+    BasisSubcircuitSensorEntityDescription(
+        key="current",
+        name="Current",
+        device_class=SensorDeviceClass.CURRENT,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+        icon="mdi:current-ac",
+        live_key="primaryCurrent",
+    ),
+    BasisSubcircuitSensorEntityDescription(
+        key="voltage",
+        name="Voltage",
+        device_class=SensorDeviceClass.VOLTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfElectricPotential.VOLT,
+        icon="mdi:sine-wave",
+        live_key="phaseVoltage",
+    ),
+)
 
 
-class BasisSubcircuitVoltageSensor(CoordinatorEntity[SwitchboardDataCoordinator], SensorEntity):
-    """Sensor for subcircuit voltage."""
+class BasisSubcircuitSensor(
+    BasisSubcircuitEntity, BasisCoordinatorSensor[SwitchboardDataCoordinator]
+):
+    """Sensor for a subcircuit live value (power, current, voltage)."""
 
-    _attr_device_class = SensorDeviceClass.VOLTAGE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-    _attr_icon = "mdi:sine-wave"
+    entity_description: BasisSubcircuitSensorEntityDescription
 
     def __init__(
-        self, coordinator: SwitchboardDataCoordinator, subcircuit: dict
+        self,
+        coordinator: SwitchboardDataCoordinator,
+        metadata_coordinator: ConfigMetadataCoordinator,
+        subcircuit: dict,
+        description: BasisSubcircuitSensorEntityDescription,
     ) -> None:
-        super().__init__(coordinator)
-        self._switchboard_serial = coordinator.serial
-        self._subcircuit_serial = subcircuit["serial"]
-        self._subcircuit_number = subcircuit["number"]
-
-    @property
-    def unique_id(self) -> str:
-        return f"basis_voltage_{self._switchboard_serial}_{self._subcircuit_serial}"
-
-    @property
-    def name(self) -> str:
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            label_key = subcircuit["config"].get("label", "spare")
-            friendly_name = LABEL_NAME_MAP.get(label_key, subcircuit["config"]["label"])
-            return f"[{self._subcircuit_number:02d}] {friendly_name} Voltage"
-        return f"[{self._subcircuit_number:02d}] Voltage"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(identifiers={(DOMAIN, self._switchboard_serial)})
+        # Set first: the base class derives the name from it
+        self.entity_description = description
+        super().__init__(coordinator, metadata_coordinator, subcircuit)
+        self._live_key = description.live_key
+        self._attr_unique_id = (
+            f"basis_{description.key}_{coordinator.serial}_{self._subcircuit_serial}"
+        )
+
+    def _update_label(self, subcircuit: dict) -> None:
+        """Derive the name (and icon, if label driven) from the subcircuit label."""
+        description = self.entity_description
+        friendly_name = subcircuit["_friendly_name"]
+        number = subcircuit["number"]
+        self._attr_name = f"[{number:02d}] {friendly_name} {description.name}"
+        if description.label_icon:
+            self._attr_icon = subcircuit["_icon"] or description.icon
 
     @property
     def native_value(self) -> float | None:
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            return subcircuit.get("liveState", {}).get("phaseVoltage")
-        return None
-
-    def _get_subcircuit(self) -> dict | None:
-        if not self.coordinator.data:
+        try:
+            return self._subcircuit["liveState"][self._live_key]
+        except (TypeError, KeyError):
             return None
-        for subcircuit in self.coordinator.data.get("subcircuits", []):
-            if subcircuit["serial"] == self._subcircuit_serial:
-                return subcircuit
-        return None
@@ -1,106 +1,103 @@
+import asyncio
+
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.core import HomeAssistant
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .coordinator import SwitchboardDataCoordinator
-from .api import BasisAPI
-from .const import (
-    DOMAIN,
-    LOGGER,
-    LABEL_ICON_MAP,
-    LABEL_NAME_MAP,
+from .coordinator import (
+    BasisConfigEntry,
+    ConfigMetadataCoordinator,
+    SwitchboardDataCoordinator,
 )
+from .api import BasisAPI
+from .const import LOGGER
+from .entity import BasisSubcircuitEntity
 
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    config_entry: BasisConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Basis switches."""
-    api: BasisAPI = hass.data[DOMAIN][config_entry.entry_id]["api"]
-    switchboard_coordinators: dict[str, SwitchboardDataCoordinator] = (
-        hass.data[DOMAIN][config_entry.entry_id]["switchboard_coordinators"]
-    )
+    runtime = config_entry.runtime_data
+    api = runtime.api
+    switchboard_coordinators = runtime.switchboards
+    metadata_coordinators = runtime.metadata
+
+    @callback
+    def _async_add_switchboard(serial: str) -> None:
+        """Add switches for a newly discovered switchboard."""
+        async_add_entities(
+            _switchboard_entities(
+                switchboard_coordinators[serial], metadata_coordinators[serial], api
+            ),
+            update_before_add=False,
+        )
+
+    runtime.add_entities[Platform.SWITCH] = _async_add_switchboard
 
     entities = []
 
     for serial, coordinator in switchboard_coordinators.items():
-        switchboard_data = coordinator.data
-        if not switchboard_data:
-            LOGGER.warning(f"No data for switchboard {serial}, skipping switches")
-            continue
+        entities.extend(
+            _switchboard_entities(coordinator, metadata_coordinators[serial], api)
+        )
+
+    async_add_entities(entities, update_before_add=False)
 
-        # Add switches (skip spare circuits and those with standby locked)
-        for subcircuit in switchboard_data.get("subcircuits", []):
-            config = subcircuit.get("config", {})
-            label = config.get("label", "")
-            standby_locked = config.get("standbyLocked", False)
 
-            if label == "spare" or standby_locked:
-                continue
-            entities.append(BasisCircuitSwitch(coordinator, api, subcircuit))
+def _switchboard_entities(
+    coordinator: SwitchboardDataCoordinator,
+    metadata_coordinator: ConfigMetadataCoordinator,
+    api: BasisAPI,
+) -> list[SwitchEntity]:
+    """Build the circuit switches for a single switchboard."""
+    switchboard_config = metadata_coordinator.data
+    if not coordinator.data or not switchboard_config:
+        LOGGER.warning(f"No data for switchboard {coordinator.serial}, skipping switches")
+        return []
 
-    async_add_entities(entities)
+    # Add switches (the coordinator filters out spare circuits and those
+    # with standby locked)
+    return [
+        BasisCircuitSwitch(coordinator, metadata_coordinator, api, subcircuit)
+        for subcircuit in switchboard_config["_switchable_subcircuits"]
+    ]
 
 
-class BasisCircuitSwitch(CoordinatorEntity[SwitchboardDataCoordinator], SwitchEntity):
+class BasisCircuitSwitch(BasisSubcircuitEntity, SwitchEntity):
     """Switch for controlling subcircuit standby state."""
 
     def __init__(
         self,
         coordinator: SwitchboardDataCoordinator,
+        metadata_coordinator: ConfigMetadataCoordinator,
         api: BasisAPI,
         subcircuit: dict,
     ) -> None:
         """Initialize the circuit switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, metadata_coordinator, subcircuit)
         self._api = api
+        # Serialises standby changes so repeated toggles do not race
+        self._mutation_lock = asyncio.Lock()
         self._switchboard_serial = coordinator.serial
-        self._subcircuit_serial = subcircuit["serial"]
-        self._subcircuit_number = subcircuit["number"]
-
-    @property
-    def unique_id(self) -> str:
-        """Return unique ID for this entity."""
-        return f"basis_switch_{self._switchboard_serial}_{self._subcircuit_serial}"
-
-    @property
-    def name(self) -> str:
-        """Return the name of the switch."""
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            label_key = subcircuit["config"].get("label", "spare")
-            friendly_name = LABEL_NAME_MAP.get(label_key, subcircuit["config"]["label"])
-            return f"[{self._subcircuit_number:02d}] {friendly_name}"
-        return f"[{self._subcircuit_number:02d}] Circuit"
+        self._attr_unique_id = f"basis_switch_{self._switchboard_serial}_{self._subcircuit_serial}"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info to link this entity to its device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._switchboard_serial)},
-        )
-
-    @property
-    def icon(self) -> str:
-        """Return the icon for this switch."""
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            label_key = subcircuit["config"].get("label", "spare")
-            return LABEL_ICON_MAP.get(label_key, "mdi:power-socket")
-        return "mdi:power-socket"
+    def _update_label(self, subcircuit: dict) -> None:
+        """Derive the name and icon from the subcircuit label."""
+        friendly_name = subcircuit["_friendly_name"]
+        number = subcircuit["number"]
+        self._attr_name = f"[{number:02d}] {friendly_name}"
+        self._attr_icon = subcircuit["_icon"] or "mdi:power-socket"
 
     @property
     def is_on(self) -> bool | None:
         """Return True if the circuit is live."""
-        subcircuit = self._get_subcircuit()
-        if subcircuit:
-            return subcircuit.get("liveState", {}).get("state") == "LIVE"
-        return None
+        if not self._subcircuit:
+            return None
+        return (self._subcircuit.get("liveState") or {}).get("state") == "LIVE"
 
     @property
     def available(self) -> bool:
@@ -114,27 +111,58 @@ class BasisCircuitSwitch(CoordinatorEntity[SwitchboardDataCoordinator], SwitchEn
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on the circuit (deactivate standby)."""
-        await self._api.set_subcircuit_standby(
-            self._switchboard_serial,
-            self._subcircuit_serial,
-            False,
-        )
-        await self.coordinator.async_request_refresh()
+        await self._async_set_standby(False)
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn off the circuit (activate standby)."""
-        await self._api.set_subcircuit_standby(
-            self._switchboard_serial,
-            self._subcircuit_serial,
-            True,
+        await self._async_set_standby(True)
+
+    async def _async_set_standby(self, standby: bool) -> None:
+        """Set the standby state and apply the resulting state locally."""
+        # Shield the whole locked section: a cancelled caller must neither
+        # abort the write mid-flight nor release the lock before it finishes
+        task = self.hass.async_create_task(self._async_set_standby_locked(standby))
+        try:
+            await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Nobody awaits the change any more; report its outcome instead
+            task.add_done_callback(_log_orphaned_standby_change)
+            raise
+
+    async def _async_set_standby_locked(self, standby: bool) -> None:
+        """Send the standby mutation and store the state it returns."""
+        async with self._mutation_lock:
+            # A queued toggle may already have been applied by the one before it
+            if self.is_on is (not standby):
+                return
+
+            result = await self._api.set_subcircuit_standby(
+                self._switchboard_serial,
+                self._subcircuit_serial,
+                standby,
+            )
+
+            updated = (result or {}).get("updateSubcircuitStandbyState") or {}
+            state = (updated.get("liveState") or {}).get("state")
+            subcircuit = self._subcircuit
+            if state is None or not subcircuit:
+                await self.coordinator.async_request_refresh()
+                return
+
+            # Apply the state returned by the mutation instead of polling the
+            # whole panel; the next scheduled update confirms it
+            if subcircuit.get("liveState") is None:
+                subcircuit["liveState"] = {}
+            subcircuit["liveState"]["state"] = state
+            self.async_write_ha_state()
+
+
+def _log_orphaned_standby_change(task: asyncio.Task) -> None:
+    """Retrieve the result of a standby change whose caller was cancelled."""
+    if task.cancelled():
+        return
+    if (err := task.exception()) is not None:
+        LOGGER.warning(
+            "Subcircuit standby update failed after its caller was cancelled: %s",
+            err,
         )
-        await self.coordinator.async_request_refresh()
-
-    def _get_subcircuit(self) -> dict | None:
-        """Get the current subcircuit data from coordinator."""
-        if not self.coordinator.data:
-            return None
-        for subcircuit in self.coordinator.data.get("subcircuits", []):
-            if subcircuit["serial"] == self._subcircuit_serial:
-                return subcircuit
-        return None